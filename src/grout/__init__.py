@@ -5,8 +5,13 @@ Create explicit tabular indices of grid tiles with offsets, counts,
 coordinate ranges, and tile positions.
 """
 
-from typing import NamedTuple, Iterator, Literal
-import math
+from typing import NamedTuple, Iterator, Literal, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+import os
+
+import numpy as np
+from numpy.typing import DTypeLike
 
 __version__ = "0.1.0"
 
@@ -38,11 +43,54 @@ class TileSpec(NamedTuple):
     ymax: float
 
 
+# Builds a TileSpec from an iterable of field values in one C-level call,
+# skipping the keyword handling of the generated TileSpec.__new__ and the
+# Python-level TileSpec._make; usable directly as a map() callable.
+_make_tile = partial(tuple.__new__, TileSpec)
+
+_INT_FIELDS = ('col', 'row', 'offset_x', 'offset_y', 'ncol', 'nrow')
+
+# Iteration converts about this many tiles (rounded to whole tile rows)
+# to Python scalars at a time
+_ITER_CHUNK_TILES = 4096
+
+# The TileSpec fields a raster block read needs
+_READ_FIELDS = ('offset_x', 'offset_y', 'ncol', 'nrow')
+
+# Grids with fewer tiles than this never touch Numba: importing it and
+# loading (or compiling) the kernel costs 0.3-1 s, which the kernel only
+# wins back over NumPy at tens of millions of tiles.
+_FAST_MIN_TILES = 1 << 24
+
+
+@lru_cache(maxsize=None)
+def _fast_fill():
+    """Return the Numba tile kernel, or None if Numba is not installed."""
+    try:
+        from ._fast import _fill
+    except ImportError:
+        return None
+    return _fill
+
+
+def _extent_to_transform(
+    extent: tuple[float, float, float, float],
+    dim: tuple[int, int],
+) -> tuple[float, float, float, float, float, float]:
+    """Convert an (xmin, xmax, ymin, ymax) extent to a GDAL geotransform."""
+    xmin, xmax, ymin, ymax = extent
+    ncol, nrow = dim
+    return (xmin, (xmax - xmin) / ncol, 0.0, ymax, 0.0, -(ymax - ymin) / nrow)
+
+
 class Grout:
     """Grid tile index generator.
     
     Creates a lazy index of tiles for a raster grid, with pixel offsets
-    and coordinate bounds for each tile.
+    and coordinate bounds for each tile. Single tiles and iteration are
+    computed on demand from per-column and per-row values; bulk access
+    (slices, ``iter_range``, ``tile_index``) builds a columnar index of the
+    whole grid once and caches it.
     
     Parameters
     ----------
@@ -54,8 +102,14 @@ class Grout:
         Coordinate extent as (xmin, xmax, ymin, ymax)
     transform : tuple of 6 floats, optional
         GDAL-style geotransform (xmin, xres, 0, ymax, 0, -yres)
+    offset_dtype : numpy dtype, default int64
+        Integer dtype for the col, row, offset and size columns
+    coord_dtype : numpy dtype, default float64
+        Float dtype for the coordinate bound columns
         
-    Must provide either extent or transform.
+    Must provide either extent or transform. Narrower dtypes (e.g. int32
+    and float32) halve the size of the materialized index, and are
+    refused with ValueError if the grid does not fit them.
     
     Examples
     --------
@@ -76,51 +130,228 @@ class Grout:
         blocksize: tuple[int, int],
         extent: tuple[float, float, float, float] | None = None,
         transform: tuple[float, float, float, float, float, float] | None = None,
+        offset_dtype: DTypeLike = np.int64,
+        coord_dtype: DTypeLike = np.float64,
     ):
         self.ncol, self.nrow = dim
         self.block_width, self.block_height = blocksize
         
         if extent is not None:
-            xmin, xmax, ymin, ymax = extent
-            self.xres = (xmax - xmin) / self.ncol
-            self.yres = (ymax - ymin) / self.nrow
-            self.xmin = xmin
-            self.ymax = ymax
-        elif transform is not None:
-            self.xmin, self.xres, _, self.ymax, _, yres = transform
-            self.yres = -yres
-        else:
+            transform = _extent_to_transform(extent, dim)
+        elif transform is None:
             raise ValueError("Must provide extent or transform")
         
-        self.tile_cols = math.ceil(self.ncol / self.block_width)
-        self.tile_rows = math.ceil(self.nrow / self.block_height)
+        # Both inputs are read through the geotransform so the georeferencing
+        # state is derived in exactly one way.
+        xmin, xres, _, ymax, _, yres = transform
+        self.xmin = float(xmin)
+        self.xres = float(xres)
+        self.ymax = float(ymax)
+        self.yres = -float(yres)
+        
+        # Integer ceiling division, exact for any size
+        self.tile_cols = -(-self.ncol // self.block_width)
+        self.tile_rows = -(-self.nrow // self.block_height)
+        self._n = self.tile_rows * self.tile_cols
+        
+        # Every tile field depends only on the tile column or only on the
+        # tile row, so compute each once per column/row here.
+        col_index = np.arange(self.tile_cols, dtype=np.int64)
+        self._col_offsets = col_index * self.block_width
+        self._col_ncol = np.minimum(self.block_width, self.ncol - self._col_offsets)
+        self._block_width_xres = self.block_width * self.xres
+        self._block_height_yres = self.block_height * self.yres
+        self._col_xmin = self.xmin + col_index * self._block_width_xres
+        self._col_xmax = self._col_xmin + self._col_ncol * self.xres
+        
+        row_index = np.arange(self.tile_rows, dtype=np.int64)
+        self._row_offsets = row_index * self.block_height
+        self._row_nrow = np.minimum(self.block_height, self.nrow - self._row_offsets)
+        self._row_ymax = self.ymax - row_index * self._block_height_yres
+        self._row_ymin = self._row_ymax - self._row_nrow * self.yres
+        
+        self._record_dtype = self._check_dtypes(
+            np.dtype(offset_dtype), np.dtype(coord_dtype)
+        )
+        self._soa = None
+    
+    def _check_dtypes(
+        self,
+        offset_dtype: np.dtype,
+        coord_dtype: np.dtype,
+    ) -> np.dtype:
+        """Validate the output dtypes against the grid and return the record dtype.
+        
+        The fit checks only apply to dtypes narrower than the 64-bit
+        defaults, so any grid accepted with the defaults stays accepted.
+        """
+        if not np.issubdtype(offset_dtype, np.integer):
+            raise ValueError(
+                f"offset_dtype must be an integer dtype, not {offset_dtype}"
+            )
+        if not np.issubdtype(coord_dtype, np.floating):
+            raise ValueError(
+                f"coord_dtype must be a floating dtype, not {coord_dtype}"
+            )
+        
+        narrow_offsets = offset_dtype.itemsize < 8
+        if narrow_offsets and max(self.ncol, self.nrow) > np.iinfo(offset_dtype).max:
+            raise ValueError(
+                f"Grid of {self.ncol} x {self.nrow} pixels does not fit "
+                f"offset_dtype {offset_dtype}"
+            )
+        if coord_dtype.itemsize < 8:
+            # Coordinates must still resolve single pixels: |coord| / res has
+            # to stay within the mantissa of coord_dtype. A zero resolution
+            # axis has no pixels to resolve.
+            ymin = self.ymax - self.nrow * self.yres
+            xmax = self.xmin + self.ncol * self.xres
+            axes = ((self.xmin, xmax, self.xres), (ymin, self.ymax, self.yres))
+            steps = max(
+                [max(abs(lo), abs(hi)) / abs(res) for lo, hi, res in axes if res],
+                default=0,
+            )
+            if steps > 2 ** np.finfo(coord_dtype).nmant:
+                raise ValueError(
+                    f"coord_dtype {coord_dtype} cannot resolve single pixels "
+                    "of this grid"
+                )
+        return np.dtype([
+            (name, offset_dtype if name in _INT_FIELDS else coord_dtype)
+            for name in TileSpec._fields
+        ])
+    
+    def _ensure_soa(self) -> dict[str, np.ndarray]:
+        """Return the cached struct-of-arrays tile index, building it once.
+        
+        The arrays are flagged read-only since views of them are handed out
+        by slicing and ``tile_index``.
+        """
+        if self._soa is None:
+            soa = self._columns()
+            for arr in soa.values():
+                arr.flags.writeable = False
+            self._soa = soa
+        return self._soa
+    
+    def _columns(
+        self,
+        idx: np.ndarray | None = None,
+        fields: Sequence[str] | None = None,
+    ) -> dict[str, np.ndarray]:
+        """Compute tile fields as flat arrays.
+        
+        Returns a dict mapping ``TileSpec`` field names (all of them, or just
+        ``fields``) to 1-D arrays in the grid's ``offset_dtype`` (pixel
+        fields) or ``coord_dtype`` (coordinates). With ``idx`` None every
+        tile is computed in row-major order, otherwise only the tiles at the
+        given (non-negative, in range) linear indices.
+        """
+        if fields is None:
+            fields = TileSpec._fields
+        if idx is None:
+            fill = _fast_fill() if self._n >= _FAST_MIN_TILES else None
+            if fill is not None:
+                out = self._fill_columns(fill)
+                return {name: out[name] for name in fields}
+            tc = np.arange(self.tile_cols, dtype=np.int64)
+            tr = np.arange(self.tile_rows, dtype=np.int64)
+            tr, tc = (a.ravel() for a in np.meshgrid(tr, tc, indexing='ij'))
+        else:
+            tr, tc = np.divmod(idx, self.tile_cols)
+        
+        per_col = {
+            'col': np.arange(self.tile_cols, dtype=np.int64),
+            'offset_x': self._col_offsets, 'ncol': self._col_ncol,
+            'xmin': self._col_xmin, 'xmax': self._col_xmax,
+        }
+        per_row = {
+            'row': np.arange(self.tile_rows, dtype=np.int64),
+            'offset_y': self._row_offsets, 'nrow': self._row_nrow,
+            'ymin': self._row_ymin, 'ymax': self._row_ymax,
+        }
+        dtypes = self._record_dtype.fields
+        return {
+            name: (per_col[name][tc] if name in per_col else per_row[name][tr])
+            .astype(dtypes[name][0], copy=False)
+            for name in fields
+        }
+    
+    def _take(
+        self,
+        idx: np.ndarray,
+        fields: Sequence[str] | None = None,
+    ) -> dict[str, np.ndarray]:
+        """Tile columns for the linear indices ``idx``.
+        
+        Taken from the columnar cache if it has been built, otherwise
+        computed for just these tiles so a small batch never builds the
+        whole grid.
+        """
+        if self._soa is None:
+            return self._columns(idx, fields=fields)
+        if fields is None:
+            fields = TileSpec._fields
+        return {name: self._soa[name][idx] for name in fields}
+    
+    def _fill_columns(self, fill, workers: int | None = None) -> dict[str, np.ndarray]:
+        """Compute every tile field with the compiled kernel ``fill``.
+        
+        The kernel releases the GIL, so the grid is split with
+        ``index_partition`` and the partitions are filled from ``workers``
+        threads into shared output arrays, one per CPU by default. Only
+        grids of at least ``_FAST_MIN_TILES`` reach the kernel, so the pool
+        always has enough work to pay for itself.
+        """
+        out = {
+            name: np.empty(self._n, dtype=self._record_dtype[name])
+            for name in TileSpec._fields
+        }
+        args = (
+            self.tile_cols, self.block_width, self.block_height,
+            self.ncol, self.nrow,
+            self.xmin, self.ymax, self.xres, self.yres,
+            *out.values()
+        )
+        if workers is None:
+            workers = os.cpu_count() or 1
+        
+        if workers <= 1:
+            fill(0, self._n, *args)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(fill, start, stop, *args)
+                    for start, stop in self.index_partition(workers)
+                ]
+                for future in futures:
+                    future.result()
+        return out
+    
+    def _iter_tuples(self) -> Iterator[tuple]:
+        """Iterate over all tiles as plain 10-tuples in TileSpec field order.
+        
+        Tiles are converted to Python scalars one chunk of whole tile rows
+        at a time, so memory stays bounded on any grid. Chunks are sliced
+        from the columnar cache if it has been built, else computed.
+        """
+        tile_cols = max(self.tile_cols, 1)
+        step = tile_cols * max(1, _ITER_CHUNK_TILES // tile_cols)
+        for start in range(0, self._n, step):
+            stop = min(start + step, self._n)
+            if self._soa is not None:
+                columns = {name: arr[start:stop] for name, arr in self._soa.items()}
+            else:
+                columns = self._columns(np.arange(start, stop, dtype=np.int64))
+            yield from zip(*(arr.tolist() for arr in columns.values()))
     
     def __iter__(self) -> Iterator[TileSpec]:
         """Iterate over all tiles in row-major order."""
-        for tr in range(self.tile_rows):
-            for tc in range(self.tile_cols):
-                offset_x = tc * self.block_width
-                offset_y = tr * self.block_height
-                
-                ncol = min(self.block_width, self.ncol - offset_x)
-                nrow = min(self.block_height, self.nrow - offset_y)
-                
-                tile_xmin = self.xmin + offset_x * self.xres
-                tile_xmax = tile_xmin + ncol * self.xres
-                tile_ymax = self.ymax - offset_y * self.yres
-                tile_ymin = tile_ymax - nrow * self.yres
-                
-                yield TileSpec(
-                    col=tc, row=tr,
-                    offset_x=offset_x, offset_y=offset_y,
-                    ncol=ncol, nrow=nrow,
-                    xmin=tile_xmin, xmax=tile_xmax,
-                    ymin=tile_ymin, ymax=tile_ymax
-                )
+        return map(_make_tile, self._iter_tuples())
     
     def __len__(self) -> int:
         """Total number of tiles."""
-        return self.tile_rows * self.tile_cols
+        return self._n
     
     def __repr__(self) -> str:
         return (
@@ -130,7 +361,32 @@ class Grout:
         )
         
     def __getitem__(self, idx):
-        """Get tile by linear index or (col, row) tuple."""
+        """Get tile by linear index or (col, row) tuple.
+        
+        A slice, list or 1-D integer array of (non-negative) linear indices
+        returns a batch instead: a dict of arrays as in ``tile_index``,
+        computed for just those tiles (or taken from the columnar cache if
+        it is already built). Workers handed a range by ``index_partition``
+        should use ``g[start:stop]`` rather than calling ``g[i]`` for each
+        index.
+        """
+        if isinstance(idx, slice):
+            return self._take(np.arange(*idx.indices(self._n), dtype=np.int64))
+        if isinstance(idx, (list, np.ndarray)):
+            idx = np.asarray(idx)
+            if idx.ndim != 1:
+                raise IndexError(f"Tile index arrays must be 1-D, not {idx.ndim}-D")
+            if idx.size == 0:
+                idx = idx.astype(np.int64)
+            elif not np.issubdtype(idx.dtype, np.integer):
+                # Includes bool: masks are not supported, and must not be
+                # silently read as indices 0 and 1
+                raise TypeError(f"Tile indices must be integers, not {idx.dtype}")
+            # Same rule as a scalar index: no negative indices
+            if idx.size and (idx.min() < 0 or idx.max() >= self._n):
+                raise IndexError("Tile index out of range")
+            return self._take(idx)
+        
         if isinstance(idx, tuple):
             tc, tr = idx
         else:
@@ -140,46 +396,121 @@ class Grout:
         if not (0 <= tc < self.tile_cols and 0 <= tr < self.tile_rows):
             raise IndexError(f"Tile index out of range: {idx}")
         
-        offset_x = tc * self.block_width
-        offset_y = tr * self.block_height
-        ncol = min(self.block_width, self.ncol - offset_x)
-        nrow = min(self.block_height, self.nrow - offset_y)
-        
-        tile_xmin = self.xmin + offset_x * self.xres
-        tile_xmax = tile_xmin + ncol * self.xres
-        tile_ymax = self.ymax - offset_y * self.yres
-        tile_ymin = tile_ymax - nrow * self.yres
-        
-        return TileSpec(
-            col=tc, row=tr,
-            offset_x=offset_x, offset_y=offset_y,
-            ncol=ncol, nrow=nrow,
-            xmin=tile_xmin, xmax=tile_xmax,
-            ymin=tile_ymin, ymax=tile_ymax
+        # One tile straight from the per-column/per-row arrays, without
+        # building the full-grid columns
+        values = (
+            tc, tr,
+            self._col_offsets[tc], self._row_offsets[tr],
+            self._col_ncol[tc], self._row_nrow[tr],
+            self._col_xmin[tc], self._col_xmax[tc],
+            self._row_ymin[tr], self._row_ymax[tr],
         )
+        dtypes = self._record_dtype
+        return _make_tile([dtypes[i].type(v).item() for i, v in enumerate(values)])
 
     def index_partition(self, n: int):
-        """Yield n index ranges (start, stop) — no tiles materialized."""
-        per_chunk = math.ceil(len(self) / n)
+        """Yield n index ranges (start, stop) — no tiles materialized.
+        
+        Consume a range with ``iter_range(start, stop)``, ``iter_reads``
+        or ``g[start:stop]`` rather than calling ``g[i]`` per index.
+        """
+        per_chunk = -(-self._n // n)
         for i in range(n):
             start = i * per_chunk
-            stop = min(start + per_chunk, len(self))
+            stop = min(start + per_chunk, self._n)
             if start < stop:
                 yield (start, stop)
+    
+    def _range_index(self, start: int, stop: int) -> np.ndarray:
+        """Linear indices of [start, stop), clipped to the grid like a slice."""
+        return np.arange(*slice(start, stop).indices(self._n), dtype=np.int64)
+    
+    def iter_range(self, start: int, stop: int) -> Iterator[TileSpec]:
+        """Iterate over the tiles with linear index in [start, stop).
+        
+        Only this range is computed unless the columnar cache already exists.
+        """
+        columns = self._take(self._range_index(start, stop))
+        return map(_make_tile, zip(*(arr.tolist() for arr in columns.values())))
+    
+    def iter_reads(self, start: int, stop: int) -> Iterator[tuple[int, int, int, int]]:
+        """Iterate over (offset_x, offset_y, ncol, nrow) for tiles in [start, stop).
+        
+        These are the arguments of a raster block read, e.g.
+        ``band.ReadAsArray(*read)``; the coordinate fields are skipped.
+        """
+        columns = self._take(self._range_index(start, stop), fields=_READ_FIELDS)
+        return zip(*(arr.tolist() for arr in columns.values()))
 
-def tile_index(g: Grout, backend: Literal['pandas', 'polars', 'list'] = 'pandas'):
+def _arrow_table(columns: dict[str, np.ndarray]):
+    """Wrap tile columns in a pyarrow Table without copying.
+    
+    Returns None if pyarrow is not installed.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return None
+    return pa.table({name: pa.array(arr) for name, arr in columns.items()})
+
+
+def _scan_polars(g: Grout):
+    """Expose the tile index of g as a polars LazyFrame.
+    
+    Tiles are generated in batches when the frame is collected, and only
+    the columns the query projects are computed.
+    """
+    import polars as pl
+    try:
+        from polars.io.plugins import register_io_source
+    except ImportError:
+        raise ImportError(
+            f"backend='polars-lazy' requires polars >= 1.4 (found {pl.__version__})"
+        ) from None
+    
+    schema = pl.DataFrame({
+        name: np.empty(0, dtype=g._record_dtype[name]) for name in TileSpec._fields
+    }).schema
+    
+    def source(with_columns, predicate, n_rows, batch_size):
+        stop = len(g) if n_rows is None else min(n_rows, len(g))
+        step = max(batch_size or stop, 1)
+        for start in range(0, stop, step):
+            idx = np.arange(start, min(start + step, stop), dtype=np.int64)
+            df = pl.DataFrame(g._columns(idx, fields=with_columns))
+            if predicate is not None:
+                df = df.filter(predicate)
+            yield df
+    
+    return register_io_source(source, schema=schema)
+
+
+def tile_index(
+    g: Grout,
+    backend: Literal['pandas', 'polars', 'polars-lazy', 'numpy', 'list'] = 'pandas',
+    dtype_backend: Literal['numpy', 'pyarrow'] = 'numpy',
+):
     """Materialize tile index to a DataFrame or list.
     
     Parameters
     ----------
     g : Grout
         Grid tile index
-    backend : {'pandas', 'polars', 'list'}, default 'pandas'
-        Output format
+    backend : {'pandas', 'polars', 'polars-lazy', 'numpy', 'list'}, default 'pandas'
+        Output format. 'polars-lazy' defers tile computation until the
+        frame is collected, and computes only the columns the query uses.
+        'numpy' returns one contiguous structured array with one record
+        per tile.
+    dtype_backend : {'numpy', 'pyarrow'}, default 'numpy'
+        Column dtypes of the pandas backend, as in ``pandas.read_csv``;
+        other backends only accept the default.
+        'pyarrow' (pandas >= 2.0, requires pyarrow) keeps the columns as
+        ``pd.ArrowDtype`` views of the Arrow buffers instead of NumPy arrays.
         
     Returns
     -------
-    pandas.DataFrame, polars.DataFrame, or list of TileSpec
+    pandas.DataFrame, polars.DataFrame, polars.LazyFrame, numpy.ndarray,
+    or list of TileSpec
     
     Examples
     --------
@@ -187,18 +518,56 @@ def tile_index(g: Grout, backend: Literal['pandas', 'polars', 'list'] = 'pandas'
     >>> df = tile_index(g)
     >>> df.head()
     """
-    tiles = list(g)
+    if dtype_backend not in ('numpy', 'pyarrow'):
+        raise ValueError(
+            f"Unknown dtype_backend: {dtype_backend}. Use 'numpy' or 'pyarrow'."
+        )
+    if dtype_backend != 'numpy' and backend != 'pandas':
+        raise ValueError(
+            f"dtype_backend={dtype_backend!r} only applies to backend='pandas', "
+            f"not {backend!r}"
+        )
     
     if backend == 'list':
-        return tiles
-    elif backend == 'pandas':
+        return list(g)
+    if backend == 'polars-lazy':
+        return _scan_polars(g)
+    if backend not in ('pandas', 'polars', 'numpy'):
+        raise ValueError(
+            f"Unknown backend: {backend}. "
+            "Use 'pandas', 'polars', 'polars-lazy', 'numpy', or 'list'."
+        )
+    
+    if backend == 'numpy':
+        # Compute uncached unless the columns already exist, so the records
+        # are the only full-size copy the caller ends up holding
+        columns = g._soa if g._soa is not None else g._columns()
+        records = np.empty(len(g), dtype=g._record_dtype)
+        for name, arr in columns.items():
+            records[name] = arr
+        return records
+    
+    columns = g._ensure_soa()
+    
+    # The DataFrame backends are fed column-wise, never from row tuples
+    if backend == 'pandas':
         import pandas as pd
-        return pd.DataFrame(tiles)
+        if dtype_backend == 'pyarrow':
+            table = _arrow_table(columns)
+            if table is None or not hasattr(pd, 'ArrowDtype'):
+                raise ImportError(
+                    "dtype_backend='pyarrow' requires pyarrow and pandas >= 2.0"
+                )
+            return table.to_pandas(types_mapper=pd.ArrowDtype)
+        # The cached columns are read-only, so the default frame takes its
+        # own copy to stay writable like any other DataFrame.
+        return pd.DataFrame(columns)
     elif backend == 'polars':
         import polars as pl
-        return pl.DataFrame(tiles)
-    else:
-        raise ValueError(f"Unknown backend: {backend}. Use 'pandas', 'polars', or 'list'.")
+        table = _arrow_table(columns)
+        if table is None:
+            return pl.DataFrame(columns)
+        return pl.from_arrow(table)
 
 
 __all__ = ['Grout', 'TileSpec', 'tile_index', '__version__']
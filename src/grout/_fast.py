@@ -0,0 +1,74 @@
+"""
+Optional Numba kernels for grout.
+
+Imported lazily by ``grout`` so that Numba stays an optional dependency.
+"""
+
+from numba import njit
+
+
+@njit(inline='always')
+def _imin(a, b):
+    """Branchless minimum of two signed 64-bit integers.
+    
+    ``d >> 63`` is all ones when ``d`` is negative and zero otherwise, so the
+    mask selects ``d`` only when ``a < b``. Only used in the jitted kernels,
+    where it compiles to straight-line arithmetic (or a conditional move)
+    instead of a branch that mispredicts at the grid edge; in plain Python
+    it would be slower than ``min``.
+    """
+    d = a - b
+    return b + (d & (d >> 63))
+
+
+@njit(cache=True, nogil=True)
+def _fill(start, stop, tile_cols, block_w, block_h, ncol, nrow,
+          xmin, ymax, xres, yres,
+          out_col, out_row, out_ox, out_oy, out_nc, out_nr,
+          out_xmin, out_xmax, out_ymin, out_ymax):
+    """Write the fields of tiles start..stop-1 into the output arrays.
+    
+    Output arrays are indexed by linear tile index, so callers pass arrays
+    covering at least ``stop`` tiles; disjoint ranges can be filled
+    concurrently from several threads since the GIL is released. The range
+    is walked one tile row at a time so the row-only fields are computed
+    once per row.
+    """
+    if start >= stop:
+        # Nothing to fill; also avoids dividing by tile_cols == 0 below
+        return
+    
+    # Per-tile coordinate steps, matching Grout's precomputed arrays
+    bw_xres = block_w * xres
+    bh_yres = block_h * yres
+    
+    tr = start // tile_cols
+    tc0 = start - tr * tile_cols
+    i = start
+    while i < stop:
+        oy = tr * block_h
+        nr = _imin(nrow - oy, block_h)
+        tile_ymax = ymax - tr * bh_yres
+        tile_ymin = tile_ymax - nr * yres
+        
+        row_stop = min(stop, i + tile_cols - tc0)
+        for j in range(i, row_stop):
+            tc = tc0 + (j - i)
+            ox = tc * block_w
+            nc = _imin(ncol - ox, block_w)
+            tile_xmin = xmin + tc * bw_xres
+            
+            out_col[j] = tc
+            out_row[j] = tr
+            out_ox[j] = ox
+            out_oy[j] = oy
+            out_nc[j] = nc
+            out_nr[j] = nr
+            out_xmin[j] = tile_xmin
+            out_xmax[j] = tile_xmin + nc * xres
+            out_ymin[j] = tile_ymin
+            out_ymax[j] = tile_ymax
+        
+        i = row_stop
+        tr += 1
+        tc0 = 0
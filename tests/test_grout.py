@@ -1,6 +1,7 @@
 """Tests for grout package."""
 
 import math
+import numpy as np
 from grout import Grout, TileSpec, tile_index
 
 
@@ -162,3 +163,287 @@ def test_gebco_scale():
     first = next(iter(g))
     assert first.xmin == -180.0
     assert first.ymax == 90.0
+
+
+def test_iteration_matches_getitem():
+    """Test vectorized iteration agrees with per-tile indexing, edges included."""
+    g = Grout(dim=(1000, 700), extent=(-10, 10, -7, 7), blocksize=(256, 300))
+    
+    tiles = list(g)
+    assert tiles == [g[i] for i in range(len(g))]
+    
+    # Chunked iteration across many chunks, before and after caching
+    tall = Grout(dim=(30, 100_000), extent=(0, 1, 0, 1), blocksize=(10, 10))
+    before = list(tall)
+    assert len(before) == len(tall)
+    assert before[::997] == [tall[i] for i in range(0, len(tall), 997)]
+    tall._ensure_soa()
+    assert list(tall) == before
+    assert all(isinstance(t.offset_x, int) and isinstance(t.xmin, float) for t in tiles)
+
+
+def test_getitem_batch():
+    """Test slice and index-array access returns vectorized columns."""
+    pytest = __import__('pytest')
+    g = Grout(dim=(1000, 700), extent=(-10, 10, -7, 7), blocksize=(256, 300))
+    
+    batch = g[2:9]
+    assert list(batch) == list(TileSpec._fields)
+    assert list(zip(*(a.tolist() for a in batch.values()))) == [tuple(g[i]) for i in range(2, 9)]
+    
+    picked = g[[0, len(g) - 1]]
+    assert picked['col'].tolist() == [0, g.tile_cols - 1]
+    assert picked['row'].tolist() == [0, g.tile_rows - 1]
+    assert len(g[5:5]['col']) == 0
+    assert len(g[[]]['col']) == 0
+    
+    # Same index rules as scalar access
+    with pytest.raises(IndexError):
+        g[[len(g)]]
+    with pytest.raises(IndexError):
+        g[[-1]]
+    with pytest.raises(TypeError):
+        g[np.array([True, False])]
+    with pytest.raises(IndexError):
+        g[np.array(3)]
+    with pytest.raises(IndexError):
+        g[[[0, 1], [2, 3]]]
+    
+    # Small batches don't build the full-grid columns
+    assert g._soa is None
+
+
+def test_numba_fill_matches_numpy():
+    """Test the optional Numba kernel against the NumPy column arithmetic."""
+    pytest = __import__('pytest')
+    pytest.importorskip('numba')
+    from grout import _fast_fill
+    
+    g = Grout(dim=(1000, 700), extent=(-10, 10, -7, 7), blocksize=(256, 300))
+    filled = g._fill_columns(_fast_fill())
+    vectorized = g._columns(np.arange(len(g)))
+    
+    for name in TileSpec._fields:
+        assert filled[name].dtype == vectorized[name].dtype
+        assert filled[name].tolist() == vectorized[name].tolist()
+    
+    # A range starting and ending mid tile-row
+    partial = {name: np.zeros_like(arr) for name, arr in filled.items()}
+    _fast_fill()(
+        3, 9, g.tile_cols, g.block_width, g.block_height, g.ncol, g.nrow,
+        float(g.xmin), float(g.ymax), g.xres, g.yres, *partial.values()
+    )
+    for name in TileSpec._fields:
+        assert partial[name][3:9].tolist() == vectorized[name][3:9].tolist()
+        assert not partial[name][:3].any() and not partial[name][9:].any()
+    
+    threaded = g._fill_columns(_fast_fill(), workers=3)
+    for name in TileSpec._fields:
+        assert threaded[name].tolist() == vectorized[name].tolist()
+    
+    empty = Grout(dim=(0, 0), transform=(0, 1, 0, 0, 0, -1), blocksize=(5, 5))
+    assert all(len(arr) == 0 for arr in empty._fill_columns(_fast_fill()).values())
+    assert list(empty) == []
+
+
+def test_tile_index_without_pyarrow(monkeypatch):
+    """Test DataFrame backends fall back to NumPy columns without pyarrow."""
+    pytest = __import__('pytest')
+    pd = pytest.importorskip('pandas')
+    pl = pytest.importorskip('polars')
+    monkeypatch.setitem(__import__('sys').modules, 'pyarrow', None)
+    
+    g = Grout(dim=(100, 100), extent=(0, 1, 0, 1), blocksize=(30, 50))
+    df = tile_index(g, backend='pandas')
+    assert isinstance(df, pd.DataFrame)
+    assert list(df.itertuples(index=False, name=None)) == [tuple(t) for t in g]
+    df.loc[0, 'col'] = 99
+    
+    df_pl = tile_index(g, backend='polars')
+    assert isinstance(df_pl, pl.DataFrame)
+    assert df_pl.rows() == [tuple(t) for t in g]
+
+
+def test_tile_index_polars_lazy():
+    """Test lazy polars backend with projection and filter pushdown."""
+    pytest = __import__('pytest')
+    pl = pytest.importorskip('polars')
+    
+    g = Grout(dim=(1000, 700), extent=(-10, 10, -7, 7), blocksize=(256, 300))
+    lf = tile_index(g, backend='polars-lazy')
+    
+    assert isinstance(lf, pl.LazyFrame)
+    assert lf.collect().rows() == [tuple(t) for t in g]
+    
+    reads = lf.filter(pl.col('row') == 1).select('offset_x', 'ncol').collect()
+    assert reads.columns == ['offset_x', 'ncol']
+    assert reads.rows() == [(t.offset_x, t.ncol) for t in g if t.row == 1]
+    assert lf.head(3).collect().height == 3
+
+
+def test_soa_cache_shared():
+    """Test all access paths read one cached, read-only column set."""
+    pytest = __import__('pytest')
+    g = Grout(dim=(1000, 700), extent=(-10, 10, -7, 7), blocksize=(256, 300))
+    
+    soa = g._ensure_soa()
+    assert g._ensure_soa() is soa
+    assert list(soa) == list(TileSpec._fields)
+    assert all(len(arr) == len(g) for arr in soa.values())
+    
+    assert g[(2, 1)] == g[1 * g.tile_cols + 2]
+    assert not soa['xmin'].flags.writeable
+    assert g[0:3]['xmin'].tolist() == soa['xmin'][0:3].tolist()
+    with pytest.raises(IndexError):
+        g[-1]
+
+
+def test_extent_transform_equivalent():
+    """Test extent and the matching geotransform give identical tiles."""
+    kw = dict(dim=(8640, 4320), blocksize=(500, 500))
+    from_extent = Grout(extent=(-180, 180, -90, 90), **kw)
+    from_transform = Grout(transform=(-180, 360 / 8640, 0, 90, 0, -180 / 4320), **kw)
+    
+    assert list(from_extent) == list(from_transform)
+    assert isinstance(from_extent.xmin, float)
+
+
+def test_tile_index_numpy():
+    """Test structured array backend."""
+    g = Grout(dim=(1000, 700), extent=(-10, 10, -7, 7), blocksize=(256, 300))
+    records = tile_index(g, backend='numpy')
+    
+    assert isinstance(records, np.ndarray)
+    assert records.dtype.names == TileSpec._fields
+    assert records.dtype.itemsize == 80
+    assert records.tolist() == [tuple(t) for t in g]
+    assert g._soa is None
+
+
+def test_iter_range_and_reads():
+    """Test per-partition iteration helpers."""
+    g = Grout(dim=(1000, 700), extent=(-10, 10, -7, 7), blocksize=(256, 300))
+    
+    ranges = list(g.index_partition(3))
+    tiles = [t for start, stop in ranges for t in g.iter_range(start, stop)]
+    assert tiles == list(g)
+    assert all(isinstance(t, TileSpec) for t in tiles)
+    
+    reads = list(g.iter_reads(*ranges[1]))
+    assert reads == [(t.offset_x, t.offset_y, t.ncol, t.nrow) for t in g.iter_range(*ranges[1])]
+    
+    # A worker's range is computed on its own, without the full-grid columns
+    big = Grout(dim=(1_000_000, 1_000_000), extent=(0, 1, 0, 1), blocksize=(512, 512))
+    assert list(big.iter_reads(0, 2)) == [(0, 0, 512, 512), (512, 0, 512, 512)]
+    assert list(big.iter_range(len(big) - 1, len(big))) == [big[len(big) - 1]]
+    assert big._soa is None
+
+
+def test_compact_dtypes():
+    """Test int32/float32 output and the guards that refuse them."""
+    pytest = __import__('pytest')
+    kw = dict(dim=(86400, 43200), extent=(-180, 180, -90, 90), blocksize=(512, 512))
+    g64 = Grout(**kw)
+    g32 = Grout(offset_dtype=np.int32, coord_dtype=np.float32, **kw)
+    
+    records = tile_index(g32, backend='numpy')
+    assert records.dtype.itemsize == 40
+    assert g32[5:9]['offset_x'].dtype == np.int32
+    assert g32[5:9]['xmin'].dtype == np.float32
+    assert records['offset_x'].tolist() == g64[:]['offset_x'].tolist()
+    assert np.allclose(records['xmax'], g64[:]['xmax'], atol=1e-4)
+    
+    with pytest.raises(ValueError):
+        Grout(dim=(2**31, 10), extent=(0, 1, 0, 1), blocksize=(512, 512), offset_dtype=np.int32)
+    with pytest.raises(ValueError):
+        Grout(dim=(2**24, 10), extent=(0, 1, 0, 1), blocksize=(512, 512), coord_dtype=np.float32)
+    with pytest.raises(ValueError, match='offset_dtype'):
+        Grout(dim=(10, 10), extent=(0, 1, 0, 1), blocksize=(5, 5), offset_dtype=np.float32)
+    
+    # The checks only guard narrowing; 64-bit defaults accept any grid
+    Grout(dim=(10, 10), transform=(1e12, 1e-6, 0, 1e12, 0, -1e-6), blocksize=(5, 5))
+    Grout(dim=(10, 10), transform=(0, 0, 0, 0, 0, -1), blocksize=(5, 5))
+    Grout(dim=(10, 10), transform=(0, 0, 0, 0, 0, -1), blocksize=(5, 5), coord_dtype=np.float32)
+
+
+def test_tile_index_pandas_arrow_dtypes():
+    """Test pandas backend with Arrow-backed columns."""
+    pytest = __import__('pytest')
+    pd = pytest.importorskip('pandas')
+    pytest.importorskip('pyarrow')
+    if not hasattr(pd, 'ArrowDtype'):
+        pytest.skip('pandas < 2.0')
+    
+    g = Grout(dim=(100, 100), extent=(0, 1, 0, 1), blocksize=(30, 50))
+    df = tile_index(g, backend='pandas', dtype_backend='pyarrow')
+    
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
+    assert list(df.itertuples(index=False, name=None)) == [tuple(t) for t in g]
+    
+    with pytest.raises(ValueError):
+        tile_index(g, backend='pandas', dtype_backend='cudf')
+
+
+def test_tile_index_rejects_misapplied_dtype_backend():
+    """Test dtype_backend is validated for every backend."""
+    pytest = __import__('pytest')
+    g = Grout(dim=(100, 100), extent=(0, 1, 0, 1), blocksize=(30, 50))
+    
+    with pytest.raises(ValueError):
+        tile_index(g, backend='polars', dtype_backend='bogus')
+    for backend in ('numpy', 'list', 'polars', 'polars-lazy'):
+        with pytest.raises(ValueError):
+            tile_index(g, backend=backend, dtype_backend='pyarrow')
+
+
+def test_small_grids_skip_numba(monkeypatch):
+    """Test small grids use NumPy without importing the Numba kernel."""
+    import grout
+    
+    def fail():
+        raise AssertionError("Numba kernel requested for a small grid")
+    
+    monkeypatch.setattr(grout, '_fast_fill', fail)
+    g = Grout(dim=(100, 100), extent=(0, 1, 0, 1), blocksize=(50, 50))
+    assert len(list(g)) == 4
+
+
+def test_scalar_access_stays_lazy():
+    """Test single-tile access does not build the full-grid columns."""
+    g = Grout(dim=(1_000_000, 1_000_000), extent=(0, 1, 0, 1), blocksize=(512, 512))
+    
+    last = g[len(g) - 1]
+    assert g[(g.tile_cols - 1, g.tile_rows - 1)] == last
+    assert last.ncol == 1_000_000 - 512 * (g.tile_cols - 1)
+    assert next(iter(g)) == g[0]
+    assert g._soa is None
+    
+    g32 = Grout(dim=(1000, 700), extent=(-10, 10, -7, 7), blocksize=(256, 300),
+                offset_dtype=np.int32, coord_dtype=np.float32)
+    assert g32[5] == tuple(tile_index(g32, backend='numpy')[5].tolist())
+
+
+def test_tile_index_pandas_writable():
+    """Test the pandas frame owns its data: writes work and don't reach the grid."""
+    pytest = __import__('pytest')
+    pytest.importorskip('pandas')
+    
+    g = Grout(dim=(100, 100), extent=(0, 1, 0, 1), blocksize=(50, 50))
+    df = tile_index(g, backend='pandas')
+    assert list(df.itertuples(index=False, name=None)) == [tuple(t) for t in g]
+    
+    df.loc[0, 'col'] = 99
+    df.loc[0, 'xmin'] = 5.0
+    assert df.loc[0, 'col'] == 99
+    assert g[0].col == 0 and g[0].xmin == 0.0
+    assert tile_index(g, backend='pandas').loc[0, 'col'] == 0
+
+
+def test_tile_index_polars_values():
+    """Test polars frame rows match iteration."""
+    pytest = __import__('pytest')
+    pl = pytest.importorskip('polars')
+    
+    g = Grout(dim=(100, 100), extent=(0, 1, 0, 1), blocksize=(30, 50))
+    df = tile_index(g, backend='polars')
+    assert df.rows() == [tuple(t) for t in g]